@@ -1,10 +1,28 @@
 import os
+import sys
+import mmap
 import random
 import argparse
+import asyncio
+import multiprocessing
+import tarfile
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import accumulate, cycle, islice
+from types import GeneratorType
 from typing import List, Dict, Tuple
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 # -----------------------------------------
 # Defaults & Config
 # -----------------------------------------
@@ -30,50 +48,286 @@ DEFAULT_SIZE_RANGES: Dict[str, Tuple[int, int]] = {
 
 GLOBAL_MIN_FILE_SIZE = 2 * 1024  # 2 KB
 
+# Files handed to a worker per submission
+BATCH_SIZE = 32
+
+# Files gathered per round with --executor async
+ASYNC_CHUNK_SIZE = 256
+
+# Size of the shared random buffer that file contents are sliced from
+RANDOM_POOL_SIZE = 16 * 1024 * 1024  # 16 MB
+
+# Unseeded runs redraw a slice of the pool every this many bytes of output
+POOL_REFRESH_EVERY = 1024 * 1024 * 1024  # 1 GB
+POOL_REFRESH_SIZE = 1024 * 1024          # 1 MB
+
+# Each pass over the pool starts this much further in, so data one
+# pool length apart doesn't repeat (odd, so the start keeps moving)
+POOL_LAP_SHIFT = 1024 * 1024 - 3
+
+# Files at least this big get their extents reserved up front (posix_fallocate)
+FALLOCATE_MIN_SIZE = 32 * 1024  # 32 KB
+
+# With --o-direct, only files at least this big bypass the page cache
+O_DIRECT_MIN_SIZE = 64 * 1024  # 64 KB
+
+# Flags for creating output files (O_BINARY only exists / matters on Windows)
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Output directories opened once per process, so files are created with
+# openat(2) relative to them instead of resolving the full path every time
+_USE_DIR_FD = os.open in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+_DIR_FDS: Dict[str, int] = {}
+
+_POOL = None          # page-aligned (mmap) so slices can feed O_DIRECT writes
+_pool_rng = None      # seeded generator with --seed, os.urandom otherwise
+
 # -----------------------------------------
 # Core helpers
 # -----------------------------------------
 
-def write_random_binary(path: Path, size_bytes: int, dry_run: bool = False):
+def _random_bytes(n: int) -> bytes:
     """
-    For small files it's fine to just allocate once and write once.
+    n random bytes from the pool's generator.
     """
-    if dry_run:
-        return
-    with path.open("wb") as f:
-        f.write(os.urandom(size_bytes))
+    if _pool_rng is None:
+        return os.urandom(n)
+    return _pool_rng.getrandbits(n * 8).to_bytes(n, "little")
 
 
-def create_dummy_file(
-    base_dir: Path,
-    index: int,
-    file_type: str,
-    size_bytes: int,
-    dry_run: bool = False
-) -> int:
+def init_random_pool(seed: int = None) -> None:
     """
-    Create one dummy file in base_dir and return its "actual" size in bytes.
-    In dry_run mode, no file is written but the size is returned as if it was.
+    Fill the shared random pool once, so we don't hit os.urandom per file.
+    With a seed the pool content is reproducible too.
     """
-    base_dir.mkdir(parents=True, exist_ok=True)
+    global _POOL, _pool_rng
+    _pool_rng = None if seed is None else random.Random(seed)
+    _POOL = mmap.mmap(-1, RANDOM_POOL_SIZE)
+    _POOL[:] = _random_bytes(RANDOM_POOL_SIZE)
 
-    filename = f"file_{index:06d}.{file_type}"
-    path = base_dir / filename
 
-    write_random_binary(path, size_bytes, dry_run=dry_run)
+def _refresh_pool(boundary: int) -> None:
+    """
+    Redraw the pool region belonging to the given POOL_REFRESH_EVERY
+    boundary (regions rotate), so long runs don't keep cycling through
+    the exact same 16 MB.
+    """
+    start = boundary * POOL_REFRESH_SIZE % len(_POOL)
+    _POOL[start:start + POOL_REFRESH_SIZE] = _random_bytes(POOL_REFRESH_SIZE)
+
 
-    # In dry-run, pretend the size is exactly what we requested
-    if dry_run:
-        return size_bytes
+def random_chunks(size_bytes: int, position: int, align: int = 0):
+    """
+    Yield memoryview slices of the random pool adding up to size_bytes,
+    for the data at byte `position` of the whole run (the planned sizes
+    of every file before it). The slices follow from position alone, so
+    a seeded run writes the same contents whichever worker gets a file,
+    and consecutive files don't share the same content.
+    With align, the first slice starts on a multiple of align bytes.
+    """
+    if _POOL is None:
+        init_random_pool()
+
+    if _pool_rng is None:
+        # Redraw at fixed points of the output; seeded runs keep the pool
+        # as is, since a redraw racing other workers' reads isn't repeatable
+        first = position // POOL_REFRESH_EVERY + 1
+        for boundary in range(first, (position + size_bytes) // POOL_REFRESH_EVERY + 1):
+            _refresh_pool(boundary)
+
+    view = memoryview(_POOL)
+    pool_size = len(_POOL)
+    laps, offset = divmod(position, pool_size)
+    offset = (offset + laps * POOL_LAP_SHIFT) % pool_size
+    if align:
+        offset = -(-offset // align) * align % pool_size
+
+    while size_bytes > 0:
+        chunk = min(size_bytes, pool_size - offset)
+        yield view[offset:offset + chunk]
+        offset = (offset + chunk) % pool_size
+        size_bytes -= chunk
+
+
+def _dir_fd(base_dir_str: str):
+    """
+    Return a cached directory fd for base_dir_str, or None where
+    dir_fd isn't supported (e.g. Windows).
+    """
+    if not _USE_DIR_FD:
+        return None
+    fd = _DIR_FDS.get(base_dir_str)
+    if fd is None:
+        fd = _DIR_FDS[base_dir_str] = os.open(base_dir_str, os.O_RDONLY | os.O_DIRECTORY)
+    return fd
 
-    return path.stat().st_size
+
+def _close_dir_fds() -> None:
+    """
+    Close every directory fd opened by _dir_fd in this process.
+    """
+    while _DIR_FDS:
+        os.close(_DIR_FDS.popitem()[1])
 
 
-def choose_file_type(index: int, file_types: List[str]) -> str:
+def o_direct_block_size(base_dir_str: str) -> int:
+    """
+    Block size O_DIRECT writes into base_dir_str must be aligned to,
+    or 0 if the platform / filesystem doesn't accept O_DIRECT (e.g. tmpfs).
     """
-    Deterministic rotation through the given file_types.
+    if not hasattr(os, "O_DIRECT") or fcntl is None:
+        return 0
+    block = max(os.statvfs(base_dir_str).f_bsize, mmap.PAGESIZE)
+    if block > RANDOM_POOL_SIZE or RANDOM_POOL_SIZE % block:
+        return 0
+
+    # mkstemp creates a fresh file exclusively, so nothing existing is touched
+    fd, probe = tempfile.mkstemp(prefix=".o_direct_probe_", dir=base_dir_str)
+    os.close(fd)
+    try:
+        fd = os.open(probe, os.O_WRONLY | os.O_DIRECT)
+        try:
+            _write_chunks(fd, random_chunks(block, 0, align=block))
+        finally:
+            os.close(fd)
+    except OSError:
+        return 0
+    finally:
+        os.unlink(probe)
+    return block
+
+
+def _write_chunks(fd: int, chunks) -> None:
     """
-    return file_types[index % len(file_types)]
+    Write every chunk to fd.
+    """
+    for chunk in chunks:
+        # os.write may write less than asked (e.g. Linux caps one call)
+        while chunk:
+            chunk = chunk[os.write(fd, chunk):]
+
+
+def write_random_binary(
+    path: str,
+    size_bytes: int,
+    position: int,
+    dir_fd: int = None,
+    direct_block: int = 0
+):
+    """
+    Write size_bytes of random data, served straight from the random pool
+    (no per-file allocation, no copies) at `position` (see random_chunks).
+    With dir_fd, path is resolved relative to that directory.
+    With direct_block (see o_direct_block_size), files of O_DIRECT_MIN_SIZE
+    and up write their block-aligned part with O_DIRECT, the tail buffered.
+    """
+    direct_bytes = 0
+    if direct_block and size_bytes >= O_DIRECT_MIN_SIZE:
+        direct_bytes = size_bytes - size_bytes % direct_block
+    flags = _OPEN_FLAGS | os.O_DIRECT if direct_bytes else _OPEN_FLAGS
+
+    # Raw fd + os.write: skips the io layer entirely for a write-once file
+    fd = os.open(path, flags, 0o644, dir_fd=dir_fd)
+    try:
+        # Declare the final size first so the filesystem allocates once
+        if size_bytes >= FALLOCATE_MIN_SIZE and hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, size_bytes)
+        if direct_bytes:
+            _write_chunks(fd, random_chunks(direct_bytes, position, align=direct_block))
+            if direct_bytes < size_bytes:
+                # The unaligned tail can't go through O_DIRECT
+                fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) & ~os.O_DIRECT)
+        _write_chunks(fd, random_chunks(size_bytes - direct_bytes, position + direct_bytes))
+    finally:
+        os.close(fd)
+
+
+class _RandomReader:
+    """
+    Minimal file-like object serving size_bytes from the random pool
+    at `position`, for APIs that pull their data (tarfile.addfile).
+    """
+
+    def __init__(self, size_bytes: int, position: int):
+        self._chunks = random_chunks(size_bytes, position)
+        self._pending = memoryview(b"")
+
+    def read(self, n: int = -1):
+        parts = []
+        while n != 0:
+            if not self._pending:
+                self._pending = next(self._chunks, None)
+                if self._pending is None:
+                    break
+            part = self._pending if n < 0 else self._pending[:n]
+            self._pending = self._pending[len(part):]
+            parts.append(part)
+            if n > 0:
+                n -= len(part)
+        if len(parts) == 1:
+            return parts[0]
+        return b"".join(parts)
+
+
+def write_archive(archive_path: str, archive_format: str, sizes: array, exts: List[str]):
+    """
+    Write every planned file as an entry of one tar or zip archive instead
+    of a file of its own. Yields (1, entry_size) per entry so callers can
+    report progress.
+
+    zip entries are stored uncompressed: the data is random, deflating it
+    would only burn CPU.
+    """
+    now = time.time()
+    names = (
+        f"file_{index:06d}.{file_type}"
+        for index, file_type in enumerate(exts, 1)
+    )
+    positions = accumulate(sizes, initial=0)
+    if archive_format == "tar":
+        # Plain "w": the archive is a regular file, and tarfile's streaming
+        # mode re-copies its buffer on every write
+        with tarfile.open(archive_path, mode="w") as tar:
+            for name, size_bytes, position in zip(names, sizes, positions):
+                info = tarfile.TarInfo(name)
+                info.size = size_bytes
+                info.mtime = now
+                tar.addfile(info, _RandomReader(size_bytes, position))
+                yield 1, size_bytes
+    else:
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_STORED) as zf:
+            for name, size_bytes, position in zip(names, sizes, positions):
+                with zf.open(name, "w", force_zip64=size_bytes >= zipfile.ZIP64_LIMIT) as f:
+                    for chunk in random_chunks(size_bytes, position):
+                        f.write(chunk)
+                yield 1, size_bytes
+
+
+def create_dummy_file(
+    base_dir_str: str,
+    index: int,
+    file_type: str,
+    size_bytes: int,
+    position: int,
+    direct_block: int = 0
+) -> int:
+    """
+    Create one dummy file in base_dir_str and return its size in bytes.
+    position is where the file starts in the whole run (see random_chunks).
+    The size is exactly what was written, so no stat() is needed.
+    base_dir_str MUST already exist (generate_dummy_data creates it once).
+    """
+    # Plain string formatting: building a Path per file is measurable overhead
+    filename = f"file_{index:06d}.{file_type}"
+    dir_fd = _dir_fd(base_dir_str)
+    if dir_fd is None:
+        path = f"{base_dir_str}{os.sep}{filename}"
+    else:
+        path = filename
+
+    write_random_binary(path, size_bytes, position, dir_fd=dir_fd, direct_block=direct_block)
+
+    return size_bytes
 
 
 def build_size_ranges(
@@ -161,75 +415,326 @@ def estimate_sizes_for_approx_files(
 # Generator
 # -----------------------------------------
 
+def _init_worker(seed: int = None) -> None:
+    """
+    Pool initializer: make sure every worker process has the random pool.
+    With a seed it is rebuilt from that same seed, so every worker holds
+    the parent's exact pool and a file's contents don't depend on which
+    process writes it; unseeded workers keep what they inherited.
+    """
+    if seed is not None or _POOL is None:
+        init_random_pool(seed)
+
+
+def _create_one(task: Tuple[str, int, str, int, int, int]) -> int:
+    """
+    Worker entry point.
+    task = (out_dir_str, index, file_type, size_bytes, position, direct_block).
+    """
+    out_dir_str, index, file_type, size_bytes, position, direct_block = task
+    return create_dummy_file(
+        out_dir_str,
+        index,
+        file_type,
+        size_bytes,
+        position,
+        direct_block=direct_block
+    )
+
+
+def _create_batch(batch: List[Tuple[str, int, str, int, int, int]]) -> Tuple[int, int]:
+    """
+    Worker entry point for a whole batch of tasks, so one submission covers
+    BATCH_SIZE files. Returns (files_created, bytes_written).
+    """
+    return len(batch), sum(map(_create_one, batch))
+
+
+async def _create_chunk_async(chunk: List[Tuple[str, int, str, int, int, int]]) -> List[int]:
+    """
+    Start every task of chunk on the loop's executor and wait for all of them.
+    A failure is re-raised only once the whole chunk has finished, so no
+    executor call is left running when the loop is closed.
+    """
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(None, _create_one, task) for task in chunk),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def _run_async(tasks: List[Tuple[str, int, str, int, int, int]], runner: ThreadPoolExecutor):
+    """
+    Create files ASYNC_CHUNK_SIZE at a time with asyncio.gather, yielding
+    (files_created, bytes_written) per chunk like the other executors.
+    """
+    loop = asyncio.new_event_loop()
+    loop.set_default_executor(runner)
+    try:
+        for i in range(0, len(tasks), ASYNC_CHUNK_SIZE):
+            chunk = tasks[i:i + ASYNC_CHUNK_SIZE]
+            yield len(chunk), sum(loop.run_until_complete(_create_chunk_async(chunk)))
+    finally:
+        loop.close()
+
+
+def plan_files(
+    target_bytes: int,
+    file_types: List[str],
+    size_ranges: Dict[str, Tuple[int, int]]
+) -> Tuple[array, List[str]]:
+    """
+    Plan every file up front, without touching the disk.
+    Returns two parallel sequences: sizes (bytes) and extensions,
+    where entry i describes file number i + 1. The sizes add up to
+    exactly target_bytes.
+    """
+    n_types = len(file_types)
+    # (min, max) per rotation slot, looked up once per extension, not per file
+    ranges = [
+        size_ranges.get(file_type, (GLOBAL_MIN_FILE_SIZE, 64 * 1024))
+        for file_type in file_types
+    ]
+    avg_size = sum(lo + hi for lo, hi in ranges) / (2 * n_types)
+
+    drawn = []
+    cumulative = []
+    planned_bytes = 0
+    while planned_bytes < target_bytes:
+        # Files-per-type estimate for what's still missing, with a 5% margin
+        # so a single draw is almost always enough; short draws are topped up
+        rows = int((target_bytes - planned_bytes) / avg_size / n_types * 1.05) + 1
+
+        # One bulk draw per extension (choices indexes the range in C, far
+        # cheaper than a randint call per size), interleaved in rotation order
+        columns = [random.choices(range(lo, hi + 1), k=rows) for lo, hi in ranges]
+        new = [size for row in zip(*columns) for size in row]
+        drawn += new
+        cumulative += islice(accumulate(new, initial=planned_bytes), 1, None)
+        planned_bytes = cumulative[-1]
+
+    # First file at which the running total reaches the target
+    count = bisect_left(cumulative, target_bytes) + 1
+
+    sizes = array("q", drawn[:count])
+
+    # The last file takes exactly what's left of the target; a tail too
+    # small to be a file of its own is folded into the previous file
+    remaining = target_bytes - (cumulative[count - 2] if count > 1 else 0)
+    if remaining < GLOBAL_MIN_FILE_SIZE and count > 1:
+        sizes.pop()
+        sizes[-1] += remaining
+        count -= 1
+    else:
+        sizes[-1] = remaining
+
+    # Deterministic rotation through the given file_types
+    exts = list(islice(cycle(file_types), count))
+
+    return sizes, exts
+
+
+def _start_file_writers(
+    out_dir_str: str,
+    sizes: array,
+    exts: List[str],
+    workers: int,
+    executor: str,
+    seed: int = None,
+    o_direct: bool = False,
+):
+    """
+    Start creating one file per planned entry on the chosen executor.
+    Returns (results, runner): an iterator of (files_created, bytes_written)
+    per batch / chunk, and the pool to shut down afterwards (or None).
+    """
+    direct_block = 0
+    if o_direct:
+        direct_block = o_direct_block_size(out_dir_str)
+        if not direct_block:
+            print("Warning: O_DIRECT not supported here, writing through the page cache.")
+
+    # Each file's contents are fixed by where it starts in the run
+    positions = accumulate(sizes, initial=0)
+    tasks = [
+        (out_dir_str, index, file_type, size_bytes, position, direct_block)
+        for index, (size_bytes, file_type, position) in enumerate(zip(sizes, exts, positions), 1)
+    ]
+
+    # Open the directory once up front: threads share the fd and
+    # forked workers inherit it
+    _dir_fd(out_dir_str)
+
+    # Execute the plan, BATCH_SIZE files per submission
+    batches = [tasks[i:i + BATCH_SIZE] for i in range(0, len(tasks), BATCH_SIZE)]
+    runner = None
+    if workers <= 1:
+        results = map(_create_batch, batches)
+    elif executor == "process":
+        runner = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(seed,))
+        results = runner.imap_unordered(_create_batch, batches, chunksize=2)
+    elif executor == "async":
+        runner = ThreadPoolExecutor(max_workers=workers)
+        results = _run_async(tasks, runner)
+    else:
+        # Threads share this process's random pool, nothing to pickle
+        runner = ThreadPoolExecutor(max_workers=workers)
+        results = runner.map(_create_batch, batches)
+    return results, runner
+
+
+def _write_planned_files(
+    out_dir_str: str,
+    sizes: array,
+    exts: List[str],
+    target_bytes: int,
+    workers: int,
+    executor: str,
+    seed: int = None,
+    o_direct: bool = False,
+    archive_path: str = None,
+    archive_format: str = None,
+) -> Tuple[int, int]:
+    """
+    Create the files described by plan_files in out_dir_str, printing
+    progress along the way. Returns (files_created, bytes_written).
+    With archive_path, everything goes into that single archive instead
+    (no workers, dir fd or O_DIRECT involved).
+    """
+    runner = None
+    if archive_path is not None:
+        results = write_archive(archive_path, archive_format, sizes, exts)
+    else:
+        results, runner = _start_file_writers(
+            out_dir_str,
+            sizes,
+            exts,
+            workers,
+            executor,
+            seed,
+            o_direct,
+        )
+
+    files_done = 0
+    total_bytes = 0
+    last_printed_bucket = -1  # to force initial print
+    # Progress line only makes sense on a terminal (it rewrites itself with \r)
+    show_progress = sys.stdout.isatty()
+    stdout_write = sys.stdout.write
+    completed = False
+    try:
+        for batch_files, batch_bytes in results:
+            files_done += batch_files
+            total_bytes += batch_bytes
+
+            # Print only when a new 5% bucket is reached; format nothing otherwise
+            bucket = total_bytes * 20 // target_bytes
+            if show_progress and bucket != last_printed_bucket:
+                last_printed_bucket = bucket
+                percent = total_bytes * 100 // target_bytes
+                total_mb = total_bytes / (1024 * 1024)
+                stdout_write(
+                    f"[{percent:3d}%] Files: {files_done:6d} "
+                    f"| Total: {total_mb:8.2f} MB\r"
+                )
+                sys.stdout.flush()
+        completed = True
+    finally:
+        if isinstance(results, GeneratorType):
+            results.close()
+        if executor == "process" and runner is not None:
+            if completed:
+                runner.close()
+            else:
+                # Drop the batches still queued instead of letting them run
+                runner.terminate()
+            runner.join()
+        elif runner is not None:
+            runner.shutdown()
+        _close_dir_fds()
+
+    if show_progress:
+        # Move past the \r progress line before the summary
+        stdout_write("\n\n")
+
+    return files_done, total_bytes
+
+
 def generate_dummy_data(
     output_dir: Path,
     target_mb: int,
     file_types: List[str],
     size_ranges: Dict[str, Tuple[int, int]],
     dry_run: bool = False,
+    workers: int = None,
+    seed: int = None,
+    executor: str = "thread",
+    o_direct: bool = False,
+    archive_format: str = "none",
 ) -> None:
     """
     Generate dummy data up to approximately target_mb MB
     in a single folder, with many small files.
+
+    The whole plan (index, type, size) is built in memory first; a dry run
+    stops there and reports the plan. Otherwise the files are created by
+    `workers` threads (executor="thread", default min(32, 4 x CPU count))
+    or processes (executor="process", default CPU count). File I/O
+    releases the GIL, so threads are usually enough. executor="async"
+    drives the same thread pool from asyncio, ASYNC_CHUNK_SIZE files
+    per gather.
+    With o_direct, big files bypass the page cache (see write_random_binary).
+    With archive_format "tar" or "zip", a single dummy_data.<format> archive
+    holding all the files is written instead.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
     target_bytes = target_mb * 1024 * 1024
+    if workers is None:
+        cpus = os.cpu_count() or 1
+        workers = cpus if executor == "process" else min(32, cpus * 4)
 
-    total_bytes = 0
-    file_index = 0
     start_time = time.time()
-    last_printed_percent = -5  # to force initial print
-    per_ext_count = {ext: 0 for ext in file_types}
 
     print(f"Target size: ~{target_mb} MB ({target_bytes:,} bytes)")
     print(f"Output directory: {output_dir.resolve()}")
+    archive_path = None
+    if archive_format != "none":
+        archive_path = os.path.join(os.fspath(output_dir), f"dummy_data.{archive_format}")
+        print(f"Archive: {archive_path}")
     if dry_run:
         print("Mode: DRY RUN (no files will actually be created).")
     print()
 
-    while total_bytes < target_bytes:
-        file_index += 1
-        remaining = target_bytes - total_bytes
+    # Plan all files up front (no I/O)
+    sizes, exts = plan_files(target_bytes, file_types, size_ranges)
 
-        if remaining <= GLOBAL_MIN_FILE_SIZE:
-            size_bytes = remaining
-            file_type = choose_file_type(file_index, file_types)
-        else:
-            file_type = choose_file_type(file_index, file_types)
-            min_sz, max_sz = size_ranges.get(
-                file_type,
-                (GLOBAL_MIN_FILE_SIZE, 64 * 1024)
-            )
-            max_sz = min(max_sz, remaining)
-            if max_sz < min_sz:
-                size_bytes = max(min_sz, remaining)
-            else:
-                size_bytes = random.randint(min_sz, max_sz)
-
-        actual_size = create_dummy_file(
-            output_dir,
-            file_index,
-            file_type,
-            size_bytes,
-            dry_run=dry_run
+    if dry_run:
+        # Nothing to write: the plan already holds every number the summary needs
+        files_done, total_bytes = len(sizes), sum(sizes)
+    else:
+        files_done, total_bytes = _write_planned_files(
+            os.fspath(output_dir),
+            sizes,
+            exts,
+            target_bytes,
+            workers,
+            executor,
+            seed,
+            o_direct,
+            archive_path,
+            archive_format,
         )
-        total_bytes += actual_size
-        per_ext_count[file_type] += 1
-
-        percent = int((total_bytes / target_bytes) * 100)
-        # Print only every 5% to reduce slowdown
-        if percent - last_printed_percent >= 5:
-            last_printed_percent = percent
-            total_mb = total_bytes / (1024 * 1024)
-            print(
-                f"[{percent:3d}%] Files: {file_index:6d} "
-                f"| Total: {total_mb:8.2f} MB",
-                end="\r"
-            )
 
     elapsed = time.time() - start_time
-    print("\n\nDone!")
-    print(f"Created {file_index} files (or would create, in dry-run).")
+    # One counting pass over the plan instead of a dict update per file
+    per_ext_count = Counter(exts)
+
+    print("Done!")
+    print(f"Created {files_done} files (or would create, in dry-run).")
     print(f"Total size: {total_bytes / (1024 * 1024):.2f} MB")
     print(
         f"Time taken: {elapsed:.2f} seconds "
@@ -237,8 +742,8 @@ def generate_dummy_data(
     )
 
     print("\nFile count by extension:")
-    for ext, count in per_ext_count.items():
-        print(f"  .{ext}: {count} files")
+    for ext in file_types:
+        print(f"  .{ext}: {per_ext_count[ext]} files")
 
 
 # -----------------------------------------
@@ -304,6 +809,33 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Random seed for reproducible runs.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of workers creating files "
+             "(default: min(32, 4 x CPU count) threads or CPU count processes, "
+             "1 = no pool).",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["thread", "process", "async"],
+        default=None,
+        help="Run workers as threads (default), processes, "
+             "or asyncio tasks gathered over a thread pool.",
+    )
+    parser.add_argument(
+        "--o-direct",
+        action="store_true",
+        help="Write files of 64 KB and up with O_DIRECT, bypassing the page cache (Linux).",
+    )
+    parser.add_argument(
+        "--single-archive",
+        choices=["tar", "zip", "none"],
+        default="none",
+        help="Put all files into one uncompressed tar/zip archive "
+             "instead of many separate files (default: none).",
+    )
 
     return parser.parse_args()
 
@@ -314,6 +846,20 @@ def main():
     # Seed random if requested
     if args.seed is not None:
         random.seed(args.seed)
+    init_random_pool(args.seed)
+
+    if args.workers is not None and args.workers <= 0:
+        raise SystemExit("Error: --workers must be a positive integer.")
+
+    # An archive is written sequentially by the main process
+    if args.single_archive != "none" and (
+        args.workers is not None or args.executor is not None or args.o_direct
+    ):
+        raise SystemExit(
+            "Error: --workers, --executor and --o-direct cannot be used with --single-archive."
+        )
+    if args.executor is None:
+        args.executor = "thread"
 
     # Resolve output directory
     output_dir = Path(args.out)
@@ -377,6 +923,14 @@ def main():
     if args.seed is not None:
         print(f"  Random seed      : {args.seed}")
     print(f"  Dry run          : {args.dry_run}")
+    if args.workers:
+        print(f"  Workers          : {args.workers}")
+    if args.single_archive != "none":
+        print(f"  Single archive   : {args.single_archive}")
+    else:
+        print(f"  Executor         : {args.executor}")
+    if args.o_direct:
+        print("  O_DIRECT         : True")
     print()
 
     generate_dummy_data(
@@ -385,6 +939,11 @@ def main():
         file_types=enabled_types,
         size_ranges=size_ranges,
         dry_run=args.dry_run,
+        workers=args.workers,
+        seed=args.seed,
+        executor=args.executor,
+        o_direct=args.o_direct,
+        archive_format=args.single_archive,
     )
 
 